@@ -6,18 +6,40 @@
 # Add requirements.txt in repo root:
 #   streamlit>=1.34
 #   pandas>=2.0
+#   numpy>=1.24
 #   matplotlib>=3.7
 #   reportlab>=3.6
+#   numba>=0.59  (optional)
 
+import io
 import math
+import textwrap
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+# Static presets live in an imported module: the import system builds them
+# once per process, while this script body re-executes on every rerun
+from estimator_specs import (
+    WALL_HEIGHT_PRESETS, WALL_HEIGHT_INDEX, HEIGHT_FT_MAP,
+    DOOR_LOOKUP, DOOR_LABELS, DEFAULT_DOOR_IDX,
+    SHEET_LABELS, SHEET_AREA,
+    MATERIAL_SPECS, R_VALUES, WIDTH_KEYS, EstimateResult,
+)
 
 # Optional libs (used in Insulation tab)
+# Figures are built with the object API (no pyplot global figure registry),
+# so nothing accumulates across reruns and it is safe across session threads.
+try:
+    from matplotlib.figure import Figure
+except Exception:
+    Figure = None
+
+# Optional JIT for the insulation estimate kernel; plain Python/NumPy without it
 try:
-    import matplotlib.pyplot as plt
+    from numba import njit
 except Exception:
-    plt = None
+    njit = None
 
 try:
     from reportlab.pdfgen import canvas as rl_canvas
@@ -30,28 +52,66 @@ FT2_TO_M2 = 0.09290304
 
 
 # ===========================
-# Drywall Estimator (function)
+# Drywall geometry
 # ===========================
-def run_drywall_estimator():
-    WALL_HEIGHT_PRESETS = ["8 ft", "9 ft", "10 ft", "12 ft", "14 ft", "Custom"]
-    DOOR_PRESETS = [
-        ("24 x 80 in", 24 / 12, 80 / 12),
-        ("28 x 80 in", 28 / 12, 80 / 12),
-        ("30 x 80 in", 30 / 12, 80 / 12),
-        ("32 x 80 in", 32 / 12, 80 / 12),
-        ("36 x 80 in", 36 / 12, 80 / 12),
-        ("Custom", None, None),
-    ]
+def compute_rooms(L, W, H, openings, ceil_mask, waste_pct, include_rc, rc_spacing_in):
+    # Vectorized per-room math over float64 arrays (one entry per room); a few
+    # ufuncs over <= 50 rooms, cheaper than hashing the arrays for st.cache_data
+    perimeter = 2 * (L + W)
+    wall_net = np.maximum(perimeter * H - openings, 0.0)
+    ceil_f = ceil_mask.astype(np.float64)
+    ceiling = L * W * ceil_f
+    total = wall_net + ceiling
+    with_waste = total * (1.0 + (waste_pct / 100.0))
+    # RC LF: one row per spacing across the width (+1), run along the length;
+    # only for included ceilings with a real width, and only when RC is on
+    rc_rows = np.floor_divide(W * 12.0, rc_spacing_in).astype(np.int64) + 1
+    rc_lf = rc_rows * L * (ceil_f * (W > 0)) * float(include_rc)
+    return {
+        "perimeter_ft": perimeter,
+        "wall_area_net_ft2": wall_net,
+        "ceiling_area_ft2": ceiling,
+        "total_area_ft2": total,
+        "total_with_waste_ft2": with_waste,
+        "rc_lf": rc_lf,
+    }
+
 
-    # New: all common residential sheet sizes (label -> area in ft²)
-    SHEET_OPTIONS = [
-        ("4x8 (32 ft²)", 32.0),
-        ("4x9 (36 ft²)", 36.0),
-        ("4x10 (40 ft²)", 40.0),
-        ("4x12 (48 ft²)", 48.0),
-        ('54" x 8\' (36 ft²)', 36.0),  # tall board for 9' walls
+# ===========================
+# Drywall downloads (cached)
+# ===========================
+@st.cache_data(show_spinner=False)
+def build_csv_bytes(columns, records):
+    return pd.DataFrame.from_records(list(records), columns=list(columns)).to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def build_txt(sheet_label, total_waste_ft2, sheets, mat_rows,
+              labour_area_cost, labour_high_parts_cost, subtotal_no_tax, tax_pct, total_with_tax, cash_price):
+    # Simple TXT summary (abbrev)
+    lines = [
+        "Drywall Estimator Summary (per room)",
+        f"Sheet size: {sheet_label}",
+        f"Grand Total w/ waste: {total_waste_ft2:.2f} ft^2",
+        f"Sheets: {sheets}",
+        "",
+        "Costs:",
     ]
+    lines.extend(f"- {label}: {qty} → ${cost:,.2f}" for label, qty, cost in mat_rows)
+    lines += [
+        f"- Area labour: ${labour_area_cost:,.2f}",
+        f"- High-parts labour: ${labour_high_parts_cost:,.2f}",
+        f"- Subtotal (no tax): ${subtotal_no_tax:,.2f}",
+        f"- Total with tax ({tax_pct:.1f}%): ${total_with_tax:,.2f}",
+        f"- Cash price: ${cash_price:,.2f}",
+    ]
+    return "\n".join(lines)
+
 
+# ===========================
+# Drywall Estimator (function)
+# ===========================
+def run_drywall_estimator():
     st.header("Drywall Estimator (per room)")
     st.caption("Calculate drywall areas, auto material takeoff, and pricing. Windows/doors deducted, ceilings optional.")
 
@@ -78,10 +138,10 @@ def run_drywall_estimator():
             corner_bead_piece_len_ft = st.number_input("Corner bead piece length (ft)", 4.0, 12.0, 8.0, 1.0)
             sheet_label = st.selectbox(
                 "Sheet size",
-                [label for label, _ in SHEET_OPTIONS],
+                SHEET_LABELS,
                 index=0
             )
-            sheet_area = next(area for label, area in SHEET_OPTIONS if label == sheet_label)
+            sheet_area = SHEET_AREA[sheet_label]
 
     with st.expander("Resilient Channel (optional)", expanded=False):
         include_resilient_channel = st.checkbox("Include Resilient Channel", value=False)
@@ -128,139 +188,192 @@ def run_drywall_estimator():
     col_l, col_r = st.columns([1, 1])
     with col_l:
         room_count = st.number_input("Number of rooms", 1, 50, 3, 1)
+        num_high_parts = st.number_input("Number of high parts", 0, 20, 0, 1)
     with col_r:
         default_h_choice = st.selectbox("Default wall height", WALL_HEIGHT_PRESETS, index=0)
         if default_h_choice == "Custom":
             default_wall_h = st.number_input("Custom default wall height (ft)", 0.0, 20.0, 8.0, 0.1)
         else:
-            default_wall_h = float(default_h_choice.split()[0])
+            default_wall_h = HEIGHT_FT_MAP[default_h_choice]
 
-    rooms_data = []
-    rc_total_lf = 0.0  # RC total linear feet
+    n_rooms = int(room_count)
 
-    for i in range(int(room_count)):
-        st.subheader(f"Room {i+1}")
+    # Selectors that change which inputs exist stay live, outside the form
+    st.subheader("Room layout")
+    layouts = []
+    for i in range(n_rooms):
         with st.container(border=True):
-            c1, c2, c3, c4 = st.columns([1.2, 1.2, 1, 1])
+            c1, c2, c3, c4, c5 = st.columns([1.2, 1, 1, 1, 1])
             with c1:
-                name = st.text_input(f"Room name #{i+1}", value=f"Room {i+1}", key=f"name_{i}")
-            with c2:
-                length = st.number_input(f"Length (ft) #{i+1}", 0.0, 1000.0, 0.0, 0.1, key=f"len_{i}")
-            with c3:
-                width = st.number_input(f"Width (ft) #{i+1}", 0.0, 1000.0, 0.0, 0.1, key=f"wid_{i}")
-            with c4:
                 h_choice = st.selectbox(
                     f"Wall height #{i+1}",
                     WALL_HEIGHT_PRESETS,
-                    index=(["8 ft", "9 ft", "10 ft", "12 ft", "14 ft"].index(f"{int(default_wall_h)} ft")
-                           if f"{int(default_wall_h)} ft" in ["8 ft", "9 ft", "10 ft", "12 ft", "14 ft"]
-                           else len(WALL_HEIGHT_PRESETS) - 1),
+                    index=WALL_HEIGHT_INDEX.get(f"{int(default_wall_h)} ft", len(WALL_HEIGHT_PRESETS) - 1),
                     key=f"h_choice_{i}"
                 )
-                if h_choice == "Custom":
-                    height = st.number_input(f"Custom wall height (ft) #{i+1}", 0.0, 20.0, default_wall_h, 0.1, key=f"h_{i}")
-                else:
-                    height = float(h_choice.split()[0])
-
-            c5, c6, c7 = st.columns([1, 1, 1])
-            with c5:
-                include_ceiling = st.checkbox(f"Include ceiling? #{i+1}", value=True, key=f"ceil_inc_{i}")
-            with c6:
+            with c2:
                 has_windows = st.checkbox(f"Windows? #{i+1}", value=False, key=f"win_has_{i}")
-            with c7:
+            with c3:
+                num_windows = st.number_input(f"How many windows? #{i+1}", 1, 20, 1, 1, key=f"w_count_{i}") if has_windows else 0
+            with c4:
                 has_doors = st.checkbox(f"Doors? #{i+1}", value=False, key=f"door_has_{i}")
+            with c5:
+                num_doors = st.number_input(f"How many doors? #{i+1}", 1, 20, 1, 1, key=f"d_count_{i}") if has_doors else 0
 
-            # Windows
-            windows = []
-            if has_windows:
-                num_windows = st.number_input(f"How many windows? #{i+1}", 1, 20, 1, 1, key=f"w_count_{i}")
-                st.markdown("**Windows**")
-                for w in range(num_windows):
-                    wc1, wc2 = st.columns(2)
-                    with wc1:
-                        w_w = st.number_input(f"Window {w+1} width (ft) [R{i+1}]", 0.0, 100.0, 0.0, 0.1, key=f"win_w_{i}_{w}")
-                    with wc2:
-                        w_h = st.number_input(f"Window {w+1} height (ft) [R{i+1}]", 0.0, 100.0, 0.0, 0.1, key=f"win_h_{i}_{w}")
-                    windows.append((w_w, w_h))
-
-            # Doors
-            doors = []
-            if has_doors:
-                num_doors = st.number_input(f"How many doors? #{i+1}", 1, 20, 1, 1, key=f"d_count_{i}")
-                st.markdown("**Doors**")
+            door_choices = []
+            if num_doors:
+                dcols = st.columns(3)
                 for d in range(num_doors):
-                    dc1, dc2, dc3 = st.columns([1.2, 1, 1])
-                    with dc1:
-                        choice_labels = [label for label, _, _ in DOOR_PRESETS]
-                        default_door_idx = choice_labels.index("30 x 80 in") if "30 x 80 in" in choice_labels else 0
-                        door_choice = st.selectbox(f"Door {d+1} size [R{i+1}]", choice_labels, index=default_door_idx, key=f"door_choice_{i}_{d}")
+                    with dcols[d % 3]:
+                        door_choices.append(st.selectbox(f"Door {d+1} size [R{i+1}]", DOOR_LABELS, index=DEFAULT_DOOR_IDX, key=f"door_choice_{i}_{d}"))
+            layouts.append((h_choice, num_windows, door_choices))
+
+    names = []
+    L = np.empty(n_rooms, dtype=np.float64)
+    W = np.empty(n_rooms, dtype=np.float64)
+    H = np.empty(n_rooms, dtype=np.float64)
+    openings = np.zeros(n_rooms, dtype=np.float64)  # only assigned for rooms with windows/doors
+    ceil_mask = np.zeros(n_rooms, dtype=bool)
+    caption_slots = []
+
+    # Room + high-part values are batched in a form: the script reruns on
+    # Calculate rather than on every field edit.
+    with st.form("rooms_form"):
+        for i, (h_choice, num_windows, door_choices) in enumerate(layouts):
+            st.subheader(f"Room {i+1}")
+            with st.container(border=True):
+                c1, c2, c3, c4, c5 = st.columns([1.2, 1.2, 1, 1, 1])
+                with c1:
+                    name = st.text_input(f"Room name #{i+1}", value=f"Room {i+1}", key=f"name_{i}")
+                with c2:
+                    length = st.number_input(f"Length (ft) #{i+1}", 0.0, 1000.0, 0.0, 0.1, key=f"len_{i}")
+                with c3:
+                    width = st.number_input(f"Width (ft) #{i+1}", 0.0, 1000.0, 0.0, 0.1, key=f"wid_{i}")
+                with c4:
+                    include_ceiling = st.checkbox(f"Include ceiling? #{i+1}", value=True, key=f"ceil_inc_{i}")
+                with c5:
+                    if h_choice == "Custom":
+                        height = st.number_input(f"Custom wall height (ft) #{i+1}", 0.0, 20.0, default_wall_h, 0.1, key=f"h_{i}")
+                    else:
+                        height = HEIGHT_FT_MAP.get(h_choice, default_wall_h)
+
+                # Windows
+                windows = []
+                if num_windows:
+                    st.markdown("**Windows**")
+                    for w in range(num_windows):
+                        wc1, wc2 = st.columns(2)
+                        with wc1:
+                            w_w = st.number_input(f"Window {w+1} width (ft) [R{i+1}]", 0.0, 100.0, 0.0, 0.1, key=f"win_w_{i}_{w}")
+                        with wc2:
+                            w_h = st.number_input(f"Window {w+1} height (ft) [R{i+1}]", 0.0, 100.0, 0.0, 0.1, key=f"win_h_{i}_{w}")
+                        windows.append((w_w, w_h))
+
+                # Doors (sizes picked in the layout; only custom sizes need fields)
+                doors = []
+                if "Custom" in door_choices:
+                    st.markdown("**Doors**")
+                for d, door_choice in enumerate(door_choices):
                     if door_choice == "Custom":
-                        with dc2:
+                        dc1, dc2 = st.columns(2)
+                        with dc1:
                             d_w_in = st.number_input(f"Door {d+1} width (in)", 0.0, 120.0, 0.0, 0.5, key=f"door_w_in_{i}_{d}")
-                        with dc3:
+                        with dc2:
                             d_h_in = st.number_input(f"Door {d+1} height (in)", 0.0, 120.0, 0.0, 0.5, key=f"door_h_in_{i}_{d}")
                         d_w = d_w_in / 12.0
                         d_h = d_h_in / 12.0
                     else:
-                        preset = next(p for p in DOOR_PRESETS if p[0] == door_choice)
-                        d_w, d_h = preset[1], preset[2]
+                        d_w, d_h = DOOR_LOOKUP[door_choice]
                     doors.append((d_w, d_h))
 
-            # Areas
-            perimeter = 2 * (length + width)
-            wall_area_gross = perimeter * height
-            openings_area = sum(w * h for w, h in windows) + sum(w * h for w, h in doors)
-            wall_area_net = max(wall_area_gross - openings_area, 0.0)
-            ceiling_area = (length * width) if include_ceiling else 0.0
-            total_area_ft2 = wall_area_net + ceiling_area
-            waste_multiplier = 1.0 + (waste_pct / 100.0)
-            total_with_waste_ft2 = total_area_ft2 * waste_multiplier
-
-            # RC LF (if enabled)
-            if include_resilient_channel and include_ceiling and width > 0 and length > 0:
-                rows = math.floor((width * 12) / rc_spacing_in) + 1
-                rc_total_lf += rows * length
-
-            rooms_data.append({
-                "room": name,
-                "length_ft": length,
-                "width_ft": width,
-                "height_ft": height,
-                "perimeter_ft": perimeter,
-                "wall_area_net_ft2": wall_area_net,
-                "ceiling_area_ft2": ceiling_area,
-                "total_area_ft2": total_area_ft2,
-                "total_with_waste_ft2": total_with_waste_ft2,
-            })
+                names.append(name)
+                L[i], W[i], H[i] = length, width, height
+                if windows:
+                    win_arr = np.array(windows, dtype=np.float64).reshape(-1, 2)
+                    openings[i] += (win_arr[:, 0] * win_arr[:, 1]).sum()
+                if doors:
+                    door_arr = np.array(doors, dtype=np.float64).reshape(-1, 2)
+                    openings[i] += (door_arr[:, 0] * door_arr[:, 1]).sum()
+                ceil_mask[i] = include_ceiling
+
+                if show_intermediate:
+                    caption_slots.append(st.empty())
+
+        # ---------- High Parts ----------
+        st.subheader("High Parts (charged extras)")
+        st.caption("Qualify only if height > 10 ft and area > 64 ft^2. Counted for labour charge, not materials.")
+        qualifying_hp_area_ft2 = 0.0
+        qualifying_hp_count = 0
+        for hp in range(num_high_parts):
+            c1, c2 = st.columns(2)
+            with c1:
+                hp_height = st.number_input(f"High part #{hp+1} height (ft)", 0.0, 30.0, 0.0, 0.1, key=f"hp_h_{hp}")
+            with c2:
+                hp_area = st.number_input(f"High part #{hp+1} area (ft^2)", 0.0, 2000.0, 0.0, 1.0, key=f"hp_a_{hp}")
+            if hp_height > 10.0 and hp_area > 64.0:
+                qualifying_hp_area_ft2 += hp_area
+                qualifying_hp_count += 1
 
-            if show_intermediate:
-                st.caption(
-                    f"Perimeter: {perimeter:.2f} ft | Walls net: {wall_area_net:.2f} ft^2 | "
-                    f"Ceiling: {ceiling_area:.2f} ft^2 | Total: {total_area_ft2:.2f} ft^2 | "
-                    f"Waste%: {waste_pct:.1f} -> With waste: {total_with_waste_ft2:.2f} ft^2"
-                )
+        submitted = st.form_submit_button("Calculate")
 
-    # ---------- High Parts ----------
-    st.subheader("High Parts (charged extras)")
-    st.caption("Qualify only if height > 10 ft and area > 64 ft^2. Counted for labour charge, not materials.")
-    num_high_parts = st.number_input("Number of high parts", 0, 20, 0, 1)
-    qualifying_hp_area_ft2 = 0.0
-    qualifying_hp_count = 0
-    for hp in range(num_high_parts):
-        c1, c2 = st.columns(2)
-        with c1:
-            hp_height = st.number_input(f"High part #{hp+1} height (ft)", 0.0, 30.0, 0.0, 0.1, key=f"hp_h_{hp}")
-        with c2:
-            hp_area = st.number_input(f"High part #{hp+1} area (ft^2)", 0.0, 2000.0, 0.0, 1.0, key=f"hp_a_{hp}")
-        if hp_height > 10.0 and hp_area > 64.0:
-            qualifying_hp_area_ft2 += hp_area
-            qualifying_hp_count += 1
+    if submitted:
+        st.session_state["rooms_data"] = {
+            "names": names, "L": L, "W": W, "H": H, "openings": openings, "ceil_mask": ceil_mask,
+            "hp_area_ft2": qualifying_hp_area_ft2, "hp_count": qualifying_hp_count,
+        }
 
     # ---------- Summary & Takeoff ----------
-    if rooms_data:
-        df = pd.DataFrame(rooms_data)
-        df["total_area_m2"] = df["total_area_ft2"] * FT2_TO_M2
-        df["total_with_waste_m2"] = df["total_with_waste_ft2"] * FT2_TO_M2
+    # Results reflect the last Calculate and stay visible between submits
+    rooms_data = st.session_state.get("rooms_data")
+    if rooms_data is not None:
+        names = rooms_data["names"]
+        L, W, H = rooms_data["L"], rooms_data["W"], rooms_data["H"]
+        qualifying_hp_area_ft2 = rooms_data["hp_area_ft2"]
+        qualifying_hp_count = rooms_data["hp_count"]
+
+        # Frame + totals only depend on the submitted rooms and these knobs;
+        # reuse them from session state when nothing relevant changed
+        sig = hash((
+            tuple(names), L.tobytes(), W.tobytes(), H.tobytes(),
+            rooms_data["openings"].tobytes(), rooms_data["ceil_mask"].tobytes(),
+            waste_pct, include_resilient_channel, rc_spacing_in,
+        ))
+        if st.session_state.get("rooms_sig") == sig:
+            df = st.session_state["rooms_df"]
+            total_ft2, total_waste_ft2, rc_total_lf = st.session_state["rooms_totals"]
+        else:
+            # Areas (one vectorized pass over all rooms)
+            geo = compute_rooms(L, W, H, rooms_data["openings"], rooms_data["ceil_mask"], waste_pct,
+                                include_resilient_channel, rc_spacing_in)
+            df = pd.DataFrame({
+                "room": names,
+                "length_ft": L,
+                "width_ft": W,
+                "height_ft": H,
+                **geo,
+            })
+            df["total_area_m2"] = df["total_area_ft2"] * FT2_TO_M2
+            df["total_with_waste_m2"] = df["total_with_waste_ft2"] * FT2_TO_M2
+
+            total_ft2 = float(df["total_area_ft2"].sum())
+            total_waste_ft2 = float(df["total_with_waste_ft2"].sum())
+            rc_total_lf = float(df["rc_lf"].sum())  # RC total linear feet
+
+            st.session_state["rooms_sig"] = sig
+            st.session_state["rooms_df"] = df
+            st.session_state["rooms_totals"] = (total_ft2, total_waste_ft2, rc_total_lf)
+
+        perimeter = df["perimeter_ft"].to_numpy()
+        wall_net = df["wall_area_net_ft2"].to_numpy()
+        ceiling = df["ceiling_area_ft2"].to_numpy()
+        total = df["total_area_ft2"].to_numpy()
+        with_waste = df["total_with_waste_ft2"].to_numpy()
+        for i, slot in zip(range(len(names)), caption_slots):
+            slot.caption(
+                f"Perimeter: {perimeter[i]:.2f} ft | Walls net: {wall_net[i]:.2f} ft^2 | "
+                f"Ceiling: {ceiling[i]:.2f} ft^2 | Total: {total[i]:.2f} ft^2 | "
+                f"Waste%: {waste_pct:.1f} -> With waste: {with_waste[i]:.2f} ft^2"
+            )
 
         st.markdown("---")
         st.subheader("Per-room breakdown")
@@ -271,9 +384,7 @@ def run_drywall_estimator():
         ]
         st.dataframe(df[show_cols], use_container_width=True)
 
-        total_ft2 = float(df["total_area_ft2"].sum())
         total_m2 = total_ft2 * FT2_TO_M2
-        total_waste_ft2 = float(df["total_with_waste_ft2"].sum())
         total_waste_m2 = total_waste_ft2 * FT2_TO_M2
 
         c1, c2, c3, c4 = st.columns(4)
@@ -286,30 +397,35 @@ def run_drywall_estimator():
         st.markdown("---")
         st.subheader("Material Takeoff (auto)")
 
-        sheets = math.ceil(total_waste_ft2 / sheet_area) if sheet_area > 0 else 0
-
         mud_gal = (total_waste_ft2 / 1000.0) * mud_gal_per_1000
-        mud_pails = math.ceil(mud_gal / mud_pail_gal) if mud_pail_gal > 0 else 0
-
-        tape_rolls = math.ceil(total_waste_ft2 / tape_sqft_per_roll) if tape_sqft_per_roll > 0 else 0
-
         screws_qty = math.ceil(total_waste_ft2 * screws_per_sqft)
-        screws_boxes = math.ceil(screws_qty / screws_per_box) if screws_per_box > 0 else 0
-
         corner_bead_lf = (total_waste_ft2 / 1000.0) * corner_bead_lf_per_1000
-        corner_bead_pcs = math.ceil(corner_bead_lf / corner_bead_piece_len_ft) if corner_bead_piece_len_ft > 0 else 0
+
+        # All piece counts in one ceil; zero/negative divisors -> inf so the count is 0
+        amounts = np.array([total_waste_ft2, mud_gal, total_waste_ft2, screws_qty, corner_bead_lf, rc_total_lf])
+        divisors = np.array([sheet_area, mud_pail_gal, tape_sqft_per_roll, screws_per_box,
+                             corner_bead_piece_len_ft, rc_piece_length_ft], dtype=np.float64)
+        divisors[divisors <= 0] = np.inf
+        sheets, mud_pails, tape_rolls, screws_boxes, corner_bead_pcs, rc_pieces = (
+            np.ceil(amounts / divisors).astype(np.int64).tolist()
+        )
 
         colA, colB, colC = st.columns([1, 1, 1])
-        with colA:
-            st.write(f"Board area (with waste): **{total_waste_ft2:,.0f} ft^2**")
-            st.write(f"Sheets ({sheet_label}): **{sheets}**")
-            st.write(f"Mud: **{mud_gal:,.1f} gal** (~{mud_pails} pails @ {mud_pail_gal:g} gal)")
-        with colB:
-            st.write(f"Tape: **{tape_rolls} rolls** (approx)")
-            st.write(f"Screws: **{screws_qty:,} pcs** (~{screws_boxes} boxes @ {screws_per_box} pcs)")
-            st.write(f"Corner bead: **{corner_bead_pcs} pcs** (~{corner_bead_lf:,.0f} lf, {corner_bead_piece_len_ft:g} ft pieces)")
-        with colC:
-            st.write("Resilient channel: **(optional; see Unit Costs settings)**")
+        # One markdown element per column instead of one st.write per line
+        colA.markdown("\n\n".join([
+            f"Board area (with waste): **{total_waste_ft2:,.0f} ft^2**",
+            f"Sheets ({sheet_label}): **{sheets}**",
+            f"Mud: **{mud_gal:,.1f} gal** (~{mud_pails} pails @ {mud_pail_gal:g} gal)",
+        ]))
+        colB.markdown("\n\n".join([
+            f"Tape: **{tape_rolls} rolls** (approx)",
+            f"Screws: **{screws_qty:,} pcs** (~{screws_boxes} boxes @ {screws_per_box} pcs)",
+            f"Corner bead: **{corner_bead_pcs} pcs** (~{corner_bead_lf:,.0f} lf, {corner_bead_piece_len_ft:g} ft pieces)",
+        ]))
+        if include_resilient_channel:
+            colC.markdown(f"Resilient channel: **{rc_pieces} pcs** (~{rc_total_lf:,.0f} lf, {rc_piece_length_ft:g} ft pieces)")
+        else:
+            colC.markdown("Resilient channel: **(optional; see Unit Costs settings)**")
 
         # Costs & Pricing
         st.markdown("---")
@@ -322,17 +438,19 @@ def run_drywall_estimator():
         mat_screws_cost = screws_boxes * cost_screws_box
         mat_corner_cost = corner_bead_pcs * cost_corner_bead_piece
         mat_pot_lights_cost = pot_light_count * pot_light_cost
+        mat_rc_cost = rc_pieces * cost_rc_piece
 
-        materials_breakdown = [
+        mat_df = pd.DataFrame([
             ("Board (sheets)", sheets, mat_board_cost),
             ("Mud (pails)", mud_pails, mat_mud_cost),
             ("Tape (rolls)", tape_rolls, mat_tape_cost),
             ("Screws (boxes)", screws_boxes, mat_screws_cost),
             ("Corner bead (pieces)", corner_bead_pcs, mat_corner_cost),
             ("Pot lights (qty)", pot_light_count, mat_pot_lights_cost),
-        ]
+            ("Resilient channel (pieces)", rc_pieces, mat_rc_cost),
+        ], columns=["item", "qty", "cost"])
 
-        material_subtotal = sum(v for _, _, v in materials_breakdown)
+        material_subtotal = float(mat_df["cost"].sum())
 
         # Labour area: with-waste + qualifying high-part area
         charge_area_ft2 = total_waste_ft2 + qualifying_hp_area_ft2
@@ -363,49 +481,192 @@ def run_drywall_estimator():
         cash_price = subtotal_no_tax  # no tax
 
         st.markdown("#### Material Costs")
-        for label, qty, cost in materials_breakdown:
-            st.write(f"- {label}: {qty} → ${cost:,.2f}")
-        st.write(f"**Material Subtotal:** ${material_subtotal:,.2f}")
-
-        st.markdown("#### Labour Costs")
-        st.write(f"- {labour_area_label}: ${labour_area_cost:,.2f}")
-        st.write(f"- {labour_high_label}: ${labour_high_parts_cost:,.2f}")
-        st.write(f"**Labour Subtotal:** ${labour_subtotal:,.2f}")
-
-        st.markdown("#### Totals")
-        st.write(f"- **Subtotal (no tax):** ${subtotal_no_tax:,.2f}")
-        st.write(f"- **Total with tax ({tax_pct:.1f}%):** ${total_with_tax:,.2f}")
+        st.dataframe(
+            mat_df, use_container_width=True, hide_index=True,
+            column_config={"cost": st.column_config.NumberColumn(format="$%.2f")},
+        )
+        md_lines = [
+            f"**Material Subtotal:** ${material_subtotal:,.2f}",
+            "",
+            "#### Labour Costs",
+            f"- {labour_area_label}: ${labour_area_cost:,.2f}",
+            f"- {labour_high_label}: ${labour_high_parts_cost:,.2f}",
+            "",
+            f"**Labour Subtotal:** ${labour_subtotal:,.2f}",
+            "",
+            "#### Totals",
+            f"- **Subtotal (no tax):** ${subtotal_no_tax:,.2f}",
+            f"- **Total with tax ({tax_pct:.1f}%):** ${total_with_tax:,.2f}",
+        ]
+        st.markdown("\n".join(md_lines))
         st.success(f"**Cash price (no tax): ${cash_price:,.2f}**")
 
-        # Downloads
+        # Downloads (payloads cached; args are plain tuples so they hash)
         st.markdown("### Downloads")
         df_display = df[show_cols]
-        csv = df_display.to_csv(index=False).encode("utf-8")
+        csv = build_csv_bytes(tuple(show_cols), tuple(df_display.itertuples(index=False, name=None)))
         st.download_button("Download CSV (per-room)", csv, file_name="drywall_per_room.csv", mime="text/csv")
 
-        # Simple TXT summary (abbrev)
-        lines = [
-            "Drywall Estimator Summary (per room)",
-            f"Sheet size: {sheet_label}",
-            f"Grand Total w/ waste: {total_waste_ft2:.2f} ft^2",
-            f"Sheets: {sheets}",
-            "",
-            "Costs:"
-        ]
-        for label, qty, cost in materials_breakdown:
-            lines.append(f"- {label}: {qty} → ${cost:,.2f}")
-        lines += [
-            f"- Area labour: ${labour_area_cost:,.2f}",
-            f"- High-parts labour: ${labour_high_parts_cost:,.2f}",
-            f"- Subtotal (no tax): ${subtotal_no_tax:,.2f}",
-            f"- Total with tax ({tax_pct:.1f}%): ${total_with_tax:,.2f}",
-            f"- Cash price: ${cash_price:,.2f}",
-        ]
-        txt = "\n".join(lines)
+        txt = build_txt(
+            sheet_label, total_waste_ft2, sheets,
+            tuple(mat_df.itertuples(index=False, name=None)),
+            labour_area_cost, labour_high_parts_cost, subtotal_no_tax, tax_pct, total_with_tax, cash_price,
+        )
         st.download_button("Download TXT (summary)", txt, file_name="drywall_summary.txt", mime="text/plain")
 
     else:
-        st.info("Add at least one room above to see results.")
+        st.info("Enter room details above and press Calculate to see results.")
+
+
+# =================================
+# Insulation estimate math (cached)
+# =================================
+def _estimate_kernel(wall_linear_feet, wall_height, wp_cov, wp_pcs, wall_price_per_bag,
+                     cat_arr, cp_cov, cp_pcs, cat_price_per_bag,
+                     ceiling_cov_per_bag, ceiling_price_per_bag, blow_sq, vault_sq,
+                     wall_stud_spacing, cat_spacing_in,
+                     wall_labour_rate, ceiling_hourly, ceiling_hours, ceiling_flat_srchg,
+                     cathedral_hourly, cathedral_hours, cathedral_flat, num_cat):
+    # Scalar math + a (n, 3) float64 cat_arr only, so Numba can compile it.
+    # Bag counts keep math.ceil(area / coverage): coverages like 78.3 are not exact
+    # floats, so floor-div would add a bag on exact multiples. Batt counts use
+    # ceil-div -(-a // b) on inches, where the spacing divisor is exact. Each count
+    # short-circuits to 0 on a zero quantity (the untouched first-render inputs).
+
+    # Materials
+    wall_area = wall_linear_feet * wall_height
+    wall_bags = math.ceil(wall_area / wp_cov) if wall_area > 0 and wp_cov > 0 else 0
+    wall_pieces = wall_bags * wp_pcs
+    wall_cost = wall_bags * wall_price_per_bag
+
+    # Cathedrals (slope-based, one vectorized pass over all sections)
+    lengths, bws, rises = cat_arr[:, 0], cat_arr[:, 1], cat_arr[:, 2]
+    slope = np.hypot(bws * 0.5, rises)
+    total_cat_area = float(2 * (slope * lengths).sum())
+    buffered_cov = cp_cov * 1.10 if cp_cov > 0 else 0.0
+    cat_bags = math.ceil(total_cat_area / buffered_cov) if total_cat_area > 0 and buffered_cov > 0 else 0
+    cat_pieces = cat_bags * cp_pcs
+    cat_cost = cat_bags * cat_price_per_bag
+
+    # Ceiling
+    ceiling_area = max(blow_sq - vault_sq, 0.0)
+    ceiling_bags = math.ceil(ceiling_area / ceiling_cov_per_bag) if ceiling_area > 0 and ceiling_cov_per_bag else 0
+    ceiling_mat_cost = ceiling_bags * ceiling_price_per_bag
+
+    # Batt counts
+    wall_batts = int(-(-(wall_linear_feet * 12.0) // wall_stud_spacing)) if wall_linear_feet > 0 and wall_stud_spacing else 0
+    # Only the total is reported, so reduce straight away (no per-section list)
+    cat_batts_total = int((-(-(bws * 12.0) // cat_spacing_in)).sum()) if cat_spacing_in else 0
+
+    # Labour & surcharges
+    wall_lab = wall_area * wall_labour_rate
+    area_lab = (wall_area + total_cat_area) * wall_labour_rate
+    ceil_lab = ceiling_hourly * ceiling_hours + ceiling_flat_srchg
+    cat_surch = ((cathedral_hourly * cathedral_hours) + cathedral_flat) * num_cat
+
+    # Totals
+    mat_total = wall_cost + cat_cost + ceiling_mat_cost
+    lab_total = wall_lab + area_lab + ceil_lab + cat_surch
+    total_tax = (mat_total + lab_total) * 1.05
+    total_buf = total_tax * 1.10
+
+    return (
+        wall_area, wall_bags, wall_pieces, wall_cost,
+        total_cat_area, cat_bags, cat_pieces, cat_cost,
+        ceiling_area, ceiling_bags, ceiling_mat_cost,
+        wall_batts, cat_batts_total,
+        wall_lab, area_lab, ceil_lab, cat_surch,
+        mat_total, lab_total, total_tax, total_buf,
+    )
+
+
+_NO_SECTIONS = np.zeros((0, 3), dtype=np.float64)
+
+
+@st.cache_resource(show_spinner=False)
+def _jit_estimate_kernel():
+    # One dispatcher per process: the script body re-executes on every rerun, so
+    # a module-level njit() would build (and reload from disk) a fresh one each
+    # time. Lazy compile (no explicit signature); cache=True lets a new process
+    # load the compiled kernel from disk instead of recompiling.
+    return njit(cache=True)(_estimate_kernel)
+
+
+@st.cache_data(show_spinner=False)
+def compute_estimate(wall_linear_feet, wall_height, wp_cov, wp_pcs, wall_price_per_bag,
+                     cat_sections, cp_cov, cp_pcs, cat_price_per_bag,
+                     ceiling_cov_per_bag, ceiling_price_per_bag, blow_sq, vault_sq,
+                     wall_stud_spacing, cat_spacing_in,
+                     wall_labour_rate, ceiling_hourly, ceiling_hours, ceiling_flat_srchg,
+                     cathedral_hourly, cathedral_hours, cathedral_flat, num_cat):
+    # Memoized wrapper: cat_sections is a tuple of (length, base_width, rise) so
+    # the call is hashable; inputs are pinned to float/int so the kernel sees
+    # one stable type signature
+    if any(any(sec) for sec in cat_sections):
+        cat_arr = np.asarray(cat_sections, dtype=np.float64).reshape(-1, 3)
+    else:
+        cat_arr = _NO_SECTIONS  # all-zero sections contribute no area or batts
+    kernel = _estimate_kernel if njit is None else _jit_estimate_kernel()
+    return EstimateResult(*kernel(
+        float(wall_linear_feet), float(wall_height), float(wp_cov), int(wp_pcs), float(wall_price_per_bag),
+        cat_arr, float(cp_cov), int(cp_pcs), float(cat_price_per_bag),
+        float(ceiling_cov_per_bag), float(ceiling_price_per_bag), float(blow_sq), float(vault_sq),
+        float(wall_stud_spacing), float(cat_spacing_in),
+        float(wall_labour_rate), float(ceiling_hourly), float(ceiling_hours), float(ceiling_flat_srchg),
+        float(cathedral_hourly), float(cathedral_hours), float(cathedral_flat), int(num_cat),
+    ))
+
+
+# Report layout; fields are EstimateResult names
+_SUMMARY_TEMPLATE = textwrap.dedent("""\
+    Materials Summary:
+      Wall:      {wall_area:.1f} sq ft → {wall_bags} bags ({wall_pieces} pcs) = ${wall_cost:.2f}
+      Cathedral: {total_cat_area:.1f} sq ft → {cat_bags} bags ({cat_pieces} pcs) = ${cat_cost:.2f}
+      Ceiling:   {ceiling_area:.1f} sq ft → {ceiling_bags} bags = ${ceiling_mat_cost:.2f}
+
+    Labour & Surcharges:
+      Wall Labour:                  ${wall_lab:.2f}
+      Area Labour (Wall+Cathedral): ${area_lab:.2f}
+      Ceiling Labour:               ${ceil_lab:.2f}
+      Cathedral Surcharge:          ${cat_surch:.2f}
+
+    Batt Counts:
+      Wall batts: {wall_batts} pcs
+      Cathedral batts: {cat_batts_total} pcs
+
+    Totals:
+      Material Total:       ${mat_total:.2f}
+      Labour Total:         ${lab_total:.2f}
+      Total w/ Tax:         ${total_tax:.2f}
+      Total w/ Tax & Buffer:${total_buf:.2f}""")
+
+
+# =================================
+# Insulation PDF report (cached)
+# =================================
+@st.cache_data(show_spinner=False)
+def build_pdf_bytes(lines):
+    # Render in memory: no temp file, no filename shared across sessions
+    buf = io.BytesIO()
+    c = rl_canvas.Canvas(buf, pagesize=letter)
+    width, height = letter
+    y = height - 50
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(50, y, "Insulation Estimator Report")
+    y -= 30
+    # Body as text objects: one BT/ET block per page instead of a drawString per line
+    t = c.beginText(50, y)
+    t.setFont("Helvetica", 12, leading=20)
+    for line in lines:
+        t.textLine(line[:95])
+        if t.getY() < 50:
+            c.drawText(t)
+            c.showPage()
+            t = c.beginText(50, height - 50)
+            t.setFont("Helvetica", 12, leading=20)
+    c.drawText(t)
+    c.save()
+    return buf.getvalue()
 
 
 # =================================
@@ -413,43 +674,23 @@ def run_drywall_estimator():
 # (All widget keys are prefixed with 'ins_' to avoid duplicates)
 # =================================
 def run_insulation_estimator():
-    MATERIAL_SPECS = {
-        'R12': {'widths': {15: {'coverage_per_bag': 100.0, 'pieces_per_bag': 20},
-                           23: {'coverage_per_bag': 153.3, 'pieces_per_bag': 20}}},
-        'R14': {'widths': {15: {'coverage_per_bag': 78.3, 'pieces_per_bag': 16},
-                           23: {'coverage_per_bag': 120.1, 'pieces_per_bag': 16}}},
-        'R20': {'widths': {15: {'coverage_per_bag': 80.0, 'pieces_per_bag': 16},
-                           23: {'coverage_per_bag': 122.7, 'pieces_per_bag': 16}}},
-        'R22': {'widths': {15: {'coverage_per_bag': 49.0, 'pieces_per_bag': 10},
-                           23: {'coverage_per_bag': 75.1, 'pieces_per_bag': 10}}},
-        'R28': {'widths': {16: {'coverage_per_bag': 53.3, 'pieces_per_bag': 10},
-                           24: {'coverage_per_bag': 80.0, 'pieces_per_bag': 10}}},
-        'R31': {'widths': {16: {'coverage_per_bag': 42.7, 'pieces_per_bag': 8},
-                           24: {'coverage_per_bag': 64.0, 'pieces_per_bag': 8}}},
-        'R40': {'widths': {16: {'coverage_per_bag': 32.0, 'pieces_per_bag': 6},
-                           24: {'coverage_per_bag': 48.0, 'pieces_per_bag': 6}}}
-    }
-
     def draw_cost_breakdown_chart(costs):
-        if plt is None:
+        if Figure is None:
             st.info("Chart unavailable (matplotlib not installed). Add matplotlib to requirements.txt.")
             return
         labels = list(costs.keys())
         values = list(costs.values())
-        fig, ax = plt.subplots()
+        fig = Figure()
+        ax = fig.subplots()
         ax.bar(labels, values)
         ax.set_title("Cost Breakdown")
         ax.set_ylabel("Cost ($)")
         ax.set_xticklabels(labels, rotation=45, ha='right')
         st.pyplot(fig)
 
-    def draw_cathedral_diagram(base_width, rise):
-        if plt is None:
-            st.info("Diagram unavailable (matplotlib not installed).")
-            return
+    def plot_cathedral(ax, base_width, rise):
         x = [0, base_width / 2, base_width]
         y = [0, rise, 0]
-        fig, ax = plt.subplots()
         ax.plot(x, y, linewidth=2)
         ax.set_xlim(0, max(base_width, 0.1))
         ax.set_ylim(0, max(rise, 0.1))
@@ -457,189 +698,142 @@ def run_insulation_estimator():
         ax.set_xlabel("Width (ft)")
         ax.set_ylabel("Height Above Wall (ft)")
         ax.grid(True)
+
+    def draw_cathedral_diagrams(sections):
+        if Figure is None:
+            st.info("Diagram unavailable (matplotlib not installed).")
+            return
+        n = len(sections)
+        if not n:
+            return
+        # One figure with a subplot per section -> one render, one image
+        fig = Figure(figsize=(3 * n, 3))
+        axes = fig.subplots(1, n, squeeze=False)
+        for ax, (_, bw, rise) in zip(axes[0], sections):
+            plot_cathedral(ax, bw, rise)
         fig.tight_layout()
         st.pyplot(fig)
 
     st.header("Insulation Estimator")
 
-    tabs = st.tabs(["1. Materials", "2. Dimensions", "3. Labour & Surcharges", "4. Review & Download"])
+    # Selectors that change which options/inputs exist stay live, outside the form
+    mc1, mc2, mc3 = st.columns(3)
+    with mc1:
+        wall_r_value = st.selectbox("Wall Insulation R-value", R_VALUES, key="ins_r_wall")
+        wall_width = st.selectbox("Wall Insulation Width (inches)", WIDTH_KEYS[wall_r_value], key="ins_w_width")
+        wp = MATERIAL_SPECS[wall_r_value][wall_width]
+        st.write(f"Coverage: {wp.coverage_per_bag} sqft/bag, Pieces: {wp.pieces_per_bag} per bag")
+    with mc2:
+        cat_r_value = st.selectbox("Cathedral Insulation R-value", R_VALUES, key="ins_r_cat")
+        cat_width = st.selectbox("Cathedral Insulation Width (inches)", WIDTH_KEYS[cat_r_value], key="ins_c_width")
+        cp = MATERIAL_SPECS[cat_r_value][cat_width]
+        st.write(f"Coverage: {cp.coverage_per_bag} sqft/bag, Pieces: {cp.pieces_per_bag} per bag")
+    with mc3:
+        num_cat = st.number_input("Number of Cathedral Sections", min_value=1, step=1, key="ins_num_cat")
 
-    with tabs[0]:
-        st.subheader("1. Materials")
-        wall_r_value = st.selectbox("Wall Insulation R-value", list(MATERIAL_SPECS.keys()), key="ins_r_wall")
-        wall_width = st.selectbox("Wall Insulation Width (inches)", list(MATERIAL_SPECS[wall_r_value]['widths']), key="ins_w_width")
-        wp = MATERIAL_SPECS[wall_r_value]['widths'][wall_width]
-        st.write(f"Coverage: {wp['coverage_per_bag']} sqft/bag, Pieces: {wp['pieces_per_bag']} per bag")
-        wall_price_per_bag = st.number_input("Wall Price per Bag ($)", min_value=0.0, key="ins_wall_price")
+    # Everything else is batched in a form: the script reruns once on submit
+    with st.form("ins_estimate_form"):
+        tabs = st.tabs(["1. Materials", "2. Dimensions", "3. Labour & Surcharges"])
 
-        cat_r_value = st.selectbox("Cathedral Insulation R-value", list(MATERIAL_SPECS.keys()), key="ins_r_cat")
-        cat_width = st.selectbox("Cathedral Insulation Width (inches)", list(MATERIAL_SPECS[cat_r_value]['widths']), key="ins_c_width")
-        cp = MATERIAL_SPECS[cat_r_value]['widths'][cat_width]
-        st.write(f"Coverage: {cp['coverage_per_bag']} sqft/bag, Pieces: {cp['pieces_per_bag']} per bag")
-        cat_price_per_bag = st.number_input("Cathedral Price per Bag ($)", min_value=0.0, key="ins_cat_price")
+        with tabs[0]:
+            st.subheader("1. Materials")
+            wall_price_per_bag = st.number_input("Wall Price per Bag ($)", min_value=0.0, key="ins_wall_price")
+            cat_price_per_bag = st.number_input("Cathedral Price per Bag ($)", min_value=0.0, key="ins_cat_price")
 
-        ceiling_cov_per_bag = st.number_input(
-            "Blown-In Coverage per Bag (sqft/bag)", min_value=0.0, help="Sqft covered by one bag of blown-in insulation.", key="ins_blow_cov"
-        )
-        ceiling_price_per_bag = st.number_input(
-            "Blown-In Price per Bag ($)", min_value=0.0, help="Cost per bag of blown-in insulation.", key="ins_blow_price"
-        )
+            ceiling_cov_per_bag = st.number_input(
+                "Blown-In Coverage per Bag (sqft/bag)", min_value=0.0, help="Sqft covered by one bag of blown-in insulation.", key="ins_blow_cov"
+            )
+            ceiling_price_per_bag = st.number_input(
+                "Blown-In Price per Bag ($)", min_value=0.0, help="Cost per bag of blown-in insulation.", key="ins_blow_price"
+            )
 
-    with tabs[1]:
-        st.subheader("2. Dimensions")
-        st.markdown("**Walls**")
-        wall_linear_feet = st.number_input("Wall Linear Feet (ft)", min_value=0.0, key="ins_wall_lf")
-        wall_height = st.number_input("Wall Height (ft)", min_value=0.0, key="ins_wall_h")
-        wall_stud_spacing = st.selectbox("Wall Stud Spacing (inches)", [16, 24], key="ins_stud_spacing")
+        with tabs[1]:
+            st.subheader("2. Dimensions")
+            st.markdown("**Walls**")
+            wall_linear_feet = st.number_input("Wall Linear Feet (ft)", min_value=0.0, key="ins_wall_lf")
+            wall_height = st.number_input("Wall Height (ft)", min_value=0.0, key="ins_wall_h")
+            wall_stud_spacing = st.selectbox("Wall Stud Spacing (inches)", [16, 24], key="ins_stud_spacing")
+
+            st.markdown("**Cathedral Sections**")
+            cat_sections = []
+            for i in range(int(num_cat)):
+                st.markdown(f"*Section {i+1}*")
+                length = st.number_input("Length (ft)", min_value=0.0, key=f"ins_len_{i}")
+                base_width = st.number_input("Base Width (ft)", min_value=0.0, key=f"ins_wd_{i}")
+                height_above = st.number_input("Height Above Wall (ft)", min_value=0.0, key=f"ins_ht_{i}")
+                cat_sections.append((length, base_width, height_above))
+
+            st.markdown("**Truss Spacing for Cathedrals**")
+            cat_spacing_in = st.selectbox("Spacing (inches)", [16, 24], key="ins_truss_spacing")
+
+            st.markdown("**Blown-In Ceiling**")
+            blow_sq = st.number_input("Blown-in Sq Ft", min_value=0, key="ins_blow_sq")
+            vault_sq = st.number_input("Vaulted/Cathedral Excl. Sq Ft", min_value=0, key="ins_vault_sq")
+
+        with tabs[2]:
+            st.subheader("3. Labour & Surcharges")
+            wall_labour_rate = st.number_input("Wall Labour Rate per sqft ($)", min_value=0.0, key="ins_wall_lab")
+            ceiling_hourly = st.number_input("Ceiling Labour Rate per hour ($)", min_value=0.0, key="ins_ceil_rate")
+            ceiling_hours = st.number_input("Ceiling Labour Time (hours)", min_value=0.0, key="ins_ceil_hours")
+            ceiling_flat_srchg = st.number_input("Ceiling Flat Surcharge ($)", min_value=0.0, key="ins_ceil_flat")
+            cathedral_hourly = st.number_input("Cathedral Labour Rate per hour ($)", min_value=0.0, key="ins_cat_rate")
+            cathedral_hours = st.number_input("Cathedral Labour Time per section (hours)", min_value=0.0, key="ins_cat_hours")
+            cathedral_flat = st.number_input("Cathedral Flat Surcharge per section ($)", min_value=0.0, key="ins_cat_flat")
+
+        submitted = st.form_submit_button("Run Estimate")
+
+    # Review & download lives outside the form (download buttons can't be in one)
+    st.subheader("4. Review & Download")
+    if submitted:
+        # cat_sections -> tuple so the cached call can hash it
+        r = compute_estimate(
+            wall_linear_feet, wall_height, wp.coverage_per_bag, wp.pieces_per_bag, wall_price_per_bag,
+            tuple(cat_sections), cp.coverage_per_bag, cp.pieces_per_bag, cat_price_per_bag,
+            ceiling_cov_per_bag, ceiling_price_per_bag, blow_sq, vault_sq,
+            wall_stud_spacing, cat_spacing_in,
+            wall_labour_rate, ceiling_hourly, ceiling_hours, ceiling_flat_srchg,
+            cathedral_hourly, cathedral_hours, cathedral_flat, int(num_cat),
+        )
 
-        st.markdown("**Cathedral Sections**")
-        num_cat = st.number_input("Number of Cathedral Sections", min_value=1, step=1, key="ins_num_cat")
-        cat_sections = []
-        for i in range(int(num_cat)):
-            st.markdown(f"*Section {i+1}*")
-            length = st.number_input("Length (ft)", min_value=0.0, key=f"ins_len_{i}")
-            base_width = st.number_input("Base Width (ft)", min_value=0.0, key=f"ins_wd_{i}")
-            height_above = st.number_input("Height Above Wall (ft)", min_value=0.0, key=f"ins_ht_{i}")
-            cat_sections.append((length, base_width, height_above))
-
-        st.markdown("**Truss Spacing for Cathedrals**")
-        cat_spacing_in = st.selectbox("Spacing (inches)", [16, 24], key="ins_truss_spacing")
-
-        st.markdown("**Blown-In Ceiling**")
-        blow_sq = st.number_input("Blown-in Sq Ft", min_value=0, key="ins_blow_sq")
-        vault_sq = st.number_input("Vaulted/Cathedral Excl. Sq Ft", min_value=0, key="ins_vault_sq")
-
-    with tabs[2]:
-        st.subheader("3. Labour & Surcharges")
-        wall_labour_rate = st.number_input("Wall Labour Rate per sqft ($)", min_value=0.0, key="ins_wall_lab")
-        ceiling_hourly = st.number_input("Ceiling Labour Rate per hour ($)", min_value=0.0, key="ins_ceil_rate")
-        ceiling_hours = st.number_input("Ceiling Labour Time (hours)", min_value=0.0, key="ins_ceil_hours")
-        ceiling_flat_srchg = st.number_input("Ceiling Flat Surcharge ($)", min_value=0.0, key="ins_ceil_flat")
-        cathedral_hourly = st.number_input("Cathedral Labour Rate per hour ($)", min_value=0.0, key="ins_cat_rate")
-        cathedral_hours = st.number_input("Cathedral Labour Time per section (hours)", min_value=0.0, key="ins_cat_hours")
-        cathedral_flat = st.number_input("Cathedral Flat Surcharge per section ($)", min_value=0.0, key="ins_cat_flat")
-
-    with tabs[3]:
-        st.subheader("4. Review & Download")
-        if st.button("Run Estimate", key="ins_run"):
-            # Materials
-            wp_cov = wp["coverage_per_bag"]; wp_pcs = wp["pieces_per_bag"]
-            wall_area = wall_linear_feet * wall_height
-            wall_bags = math.ceil(wall_area / wp_cov) if wp_cov > 0 else 0
-            wall_pieces = wall_bags * wp_pcs
-            wall_cost = wall_bags * wall_price_per_bag
-
-            # Cathedrals (slope-based)
-            cp_cov = cp["coverage_per_bag"]; cp_pcs = cp["pieces_per_bag"]
-            total_cat_area = 0.0
-            for length, bw, rise in cat_sections:
-                slope = math.sqrt(max((bw / 2) ** 2 + rise ** 2, 0.0))
-                total_cat_area += 2 * slope * length
-            buffered_cov = cp_cov * 1.10 if cp_cov > 0 else 0
-            cat_bags = math.ceil(total_cat_area / buffered_cov) if buffered_cov > 0 else 0
-            cat_pieces = cat_bags * cp_pcs
-            cat_cost = cat_bags * cat_price_per_bag
-
-            # Ceiling
-            ceiling_area = max(blow_sq - vault_sq, 0)
-            ceiling_bags = math.ceil(ceiling_area / ceiling_cov_per_bag) if ceiling_cov_per_bag else 0
-            ceiling_mat_cost = ceiling_bags * ceiling_price_per_bag
-
-            # Batt counts
-            wall_batts = math.ceil(wall_linear_feet / (wall_stud_spacing / 12)) if wall_stud_spacing else 0
-            cat_batts = [math.ceil(bw / (cat_spacing_in / 12)) if cat_spacing_in else 0 for _, bw, _ in cat_sections]
-
-            # Labour & surcharges
-            wall_lab = wall_area * wall_labour_rate
-            area_lab = (wall_area + total_cat_area) * wall_labour_rate
-            ceil_lab = ceiling_hourly * ceiling_hours + ceiling_flat_srchg
-            cat_surch = ((cathedral_hourly * cathedral_hours) + cathedral_flat) * int(num_cat)
-
-            # Totals
-            mat_total = wall_cost + cat_cost + ceiling_mat_cost
-            lab_total = wall_lab + area_lab + ceil_lab + cat_surch
-            total_tax = (mat_total + lab_total) * 1.05
-            total_buf = total_tax * 1.10
-
-            # Build summary text
-            lines = [
-                "Materials Summary:",
-                f"  Wall:      {wall_area:.1f} sq ft → {wall_bags} bags ({wall_pieces} pcs) = ${wall_cost:.2f}",
-                f"  Cathedral: {total_cat_area:.1f} sq ft → {cat_bags} bags ({cat_pieces} pcs) = ${cat_cost:.2f}",
-                f"  Ceiling:   {ceiling_area:.1f} sq ft → {ceiling_bags} bags = ${ceiling_mat_cost:.2f}",
-                "",
-                "Labour & Surcharges:",
-                f"  Wall Labour:                  ${wall_lab:.2f}",
-                f"  Area Labour (Wall+Cathedral): ${area_lab:.2f}",
-                f"  Ceiling Labour:               ${ceil_lab:.2f}",
-                f"  Cathedral Surcharge:          ${cat_surch:.2f}",
-                "",
-                "Batt Counts:",
-                f"  Wall batts: {wall_batts} pcs",
-                f"  Cathedral batts: {sum(cat_batts)} pcs",
-                "",
-                "Totals:",
-                f"  Material Total:       ${mat_total:.2f}",
-                f"  Labour Total:         ${lab_total:.2f}",
-                f"  Total w/ Tax:         ${total_tax:.2f}",
-                f"  Total w/ Tax & Buffer:${total_buf:.2f}",
-            ]
-            summary_text = "\n".join(lines)
-
-            # Display
-            st.subheader("Materials Summary")
-            st.write(lines[1]); st.write(lines[2]); st.write(lines[3])
-
-            st.subheader("Labour & Surcharges")
-            for l in lines[5:10]:
-                st.write(l)
-
-            st.subheader("Batt Counts")
-            st.write(lines[12]); st.write(lines[13])
-
-            st.subheader("Diagrams")
-            for _, bw, rise in cat_sections:
-                draw_cathedral_diagram(bw, rise)
-
-            st.subheader("Totals")
-            for l in lines[-4:]:
-                st.write(l)
-
-            st.subheader("Cost Breakdown Chart")
-            draw_cost_breakdown_chart(
-                {
-                    "Wall Mat": wall_cost,
-                    "Cat Mat": cat_cost,
-                    "Ceil Mat": ceiling_mat_cost,
-                    "Wall Labour": wall_lab,
-                    "Area Labour": area_lab,
-                    "Ceil Labour": ceil_lab,
-                    "Cat Surcharge": cat_surch,
-                }
-            )
+        # Build summary text (one format pass over the module-level template)
+        summary_text = _SUMMARY_TEMPLATE.format_map(r._asdict())
+        lines = summary_text.splitlines()
+
+        # Display (one preformatted text element per section)
+        st.subheader("Materials Summary")
+        st.text("\n".join(lines[1:4]))
+
+        st.subheader("Labour & Surcharges")
+        st.text("\n".join(lines[5:10]))
+
+        st.subheader("Batt Counts")
+        st.text("\n".join(lines[12:14]))
+
+        st.subheader("Diagrams")
+        draw_cathedral_diagrams(cat_sections)
+
+        st.subheader("Totals")
+        st.text("\n".join(lines[-4:]))
+
+        st.subheader("Cost Breakdown Chart")
+        draw_cost_breakdown_chart(
+            {
+                "Wall Mat": r.wall_cost,
+                "Cat Mat": r.cat_cost,
+                "Ceil Mat": r.ceiling_mat_cost,
+                "Wall Labour": r.wall_lab,
+                "Area Labour": r.area_lab,
+                "Ceil Labour": r.ceil_lab,
+                "Cat Surcharge": r.cat_surch,
+            }
+        )
 
-            # PDF Export (optional lib)
-            if rl_canvas is None or letter is None:
-                st.warning("PDF export unavailable (reportlab not installed). Add reportlab to requirements.txt.")
-            else:
-                pdf_name = "insulation_estimate_output.pdf"
-                c = rl_canvas.Canvas(pdf_name, pagesize=letter)
-                width, height = letter
-                y = height - 50
-                c.setFont("Helvetica-Bold", 16)
-                c.drawString(50, y, "Insulation Estimator Report")
-                y -= 30
-                c.setFont("Helvetica", 12)
-                for line in summary_text.split("\n"):
-                    c.drawString(50, y, line[:95])
-                    y -= 20
-                    if y < 50:
-                        c.showPage()
-                        y = height - 50
-                        c.setFont("Helvetica", 12)
-                c.save()
-                with open(pdf_name, "rb") as f:
-                    st.download_button("Download PDF", f, file_name=pdf_name)
+        # PDF Export (optional lib)
+        if rl_canvas is None or letter is None:
+            st.warning("PDF export unavailable (reportlab not installed). Add reportlab to requirements.txt.")
+        else:
+            pdf_bytes = build_pdf_bytes(tuple(lines))
+            st.download_button("Download PDF", pdf_bytes, file_name="insulation_estimate_output.pdf", mime="application/pdf")
 
 
 # ============================
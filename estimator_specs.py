@@ -0,0 +1,80 @@
+# estimator_specs.py
+# Static presets for the estimators app. Imported (not defined in the app
+# script) so they are built once per process: Streamlit re-executes the app
+# script on every rerun, but imported modules stay cached in sys.modules.
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import NamedTuple
+
+# Drywall presets; the dicts give O(1) lookups instead of list scans
+WALL_HEIGHT_PRESETS = ["8 ft", "9 ft", "10 ft", "12 ft", "14 ft", "Custom"]
+WALL_HEIGHT_INDEX = {label: idx for idx, label in enumerate(WALL_HEIGHT_PRESETS) if label != "Custom"}
+HEIGHT_FT_MAP = {"8 ft": 8.0, "9 ft": 9.0, "10 ft": 10.0, "12 ft": 12.0, "14 ft": 14.0}
+DOOR_PRESETS = [
+    ("24 x 80 in", 24 / 12, 80 / 12),
+    ("28 x 80 in", 28 / 12, 80 / 12),
+    ("30 x 80 in", 30 / 12, 80 / 12),
+    ("32 x 80 in", 32 / 12, 80 / 12),
+    ("36 x 80 in", 36 / 12, 80 / 12),
+    ("Custom", None, None),
+]
+DOOR_LOOKUP = {label: (w, h) for label, w, h in DOOR_PRESETS}
+DOOR_LABELS = [label for label, _, _ in DOOR_PRESETS]
+DEFAULT_DOOR_IDX = DOOR_LABELS.index("30 x 80 in")
+
+# All common residential sheet sizes (label -> area in ft²)
+SHEET_OPTIONS = [
+    ("4x8 (32 ft²)", 32.0),
+    ("4x9 (36 ft²)", 36.0),
+    ("4x10 (40 ft²)", 40.0),
+    ("4x12 (48 ft²)", 48.0),
+    ('54" x 8\' (36 ft²)', 36.0),  # tall board for 9' walls
+]
+SHEET_LABELS = [label for label, _ in SHEET_OPTIONS]
+SHEET_AREA = dict(SHEET_OPTIONS)
+
+
+# Insulation specs (R-value -> batt width in inches -> bag spec; read-only)
+@dataclass(frozen=True, slots=True)
+class BagSpec:
+    coverage_per_bag: float
+    pieces_per_bag: int
+
+
+MATERIAL_SPECS = MappingProxyType({
+    'R12': MappingProxyType({15: BagSpec(100.0, 20), 23: BagSpec(153.3, 20)}),
+    'R14': MappingProxyType({15: BagSpec(78.3, 16), 23: BagSpec(120.1, 16)}),
+    'R20': MappingProxyType({15: BagSpec(80.0, 16), 23: BagSpec(122.7, 16)}),
+    'R22': MappingProxyType({15: BagSpec(49.0, 10), 23: BagSpec(75.1, 10)}),
+    'R28': MappingProxyType({16: BagSpec(53.3, 10), 24: BagSpec(80.0, 10)}),
+    'R31': MappingProxyType({16: BagSpec(42.7, 8), 24: BagSpec(64.0, 8)}),
+    'R40': MappingProxyType({16: BagSpec(32.0, 6), 24: BagSpec(48.0, 6)}),
+})
+R_VALUES = tuple(MATERIAL_SPECS)
+WIDTH_KEYS = MappingProxyType({r: tuple(MATERIAL_SPECS[r]) for r in R_VALUES})
+
+
+# Insulation estimate result (field order matches the estimate kernel's tuple)
+class EstimateResult(NamedTuple):
+    wall_area: float
+    wall_bags: int
+    wall_pieces: int
+    wall_cost: float
+    total_cat_area: float
+    cat_bags: int
+    cat_pieces: int
+    cat_cost: float
+    ceiling_area: float
+    ceiling_bags: int
+    ceiling_mat_cost: float
+    wall_batts: int
+    cat_batts_total: int
+    wall_lab: float
+    area_lab: float
+    ceil_lab: float
+    cat_surch: float
+    mat_total: float
+    lab_total: float
+    total_tax: float
+    total_buf: float